@@ -2,8 +2,11 @@ from ray.workflow.api import (
     step,
     init,
     get_output,
+    get_output_many,
     get_status,
+    get_status_many,
     get_metadata,
+    get_metadata_many,
     resume,
     cancel,
     list_all,
@@ -24,11 +27,14 @@ __all__ = [
     "step",
     "resume",
     "get_output",
+    "get_output_many",
     "WorkflowExecutionError",
     "resume_all",
     "cancel",
     "get_status",
+    "get_status_many",
     "get_metadata",
+    "get_metadata_many",
     "list_all",
     "init",
     "wait_for_event",
@@ -1,4 +1,3 @@
-import logging
 from typing import Dict, Set, List, Tuple, Union, Optional, Any
 import time
 
@@ -9,6 +8,7 @@ from ray.remote_function import RemoteFunction
 
 from ray.workflow import execution
 from ray.workflow.step_function import WorkflowStepFunction
+from ray.workflow.dag_to_workflow import transform_ray_dag_to_workflow
 
 # avoid collision with arguments & APIs
 
@@ -16,23 +16,52 @@ from ray.workflow.common import (
     WorkflowStatus,
     Workflow,
     Event,
-    WorkflowRunningError,
     WorkflowNotFoundError,
     WorkflowStepRuntimeOptions,
     StepType,
+    WORKFLOW_OPTIONS,
     asyncio_run,
 )
 from ray.workflow import serialization
 from ray.workflow.event_listener import EventListener, EventListenerType, TimerListener
 from ray.workflow import workflow_access
-from ray.workflow.workflow_storage import get_workflow_storage
+from ray.workflow.workflow_context import in_workflow_execution
 from ray.util.annotations import PublicAPI
 from ray._private.usage import usage_lib
 
-logger = logging.getLogger(__name__)
 
+# The Ray node (or the Ray Client worker, when connected through Ray Client)
+# that workflow was initialized with. Both are recreated whenever Ray is
+# shut down or re-initialized.
+_workflow_node: Optional["ray.node.Node"] = None
+_workflow_client_worker: Optional["ray.util.client.worker.Worker"] = None
 
-_is_workflow_initialized = False
+# All valid workflow statuses, i.e., excluding "WorkflowStatus.NONE".
+_ALL_WORKFLOW_STATUSES = frozenset(WorkflowStatus) - {WorkflowStatus.NONE}
+
+# Map the string form of each workflow status to the status. Statuses are
+# strings themselves, so they map to themselves.
+_WORKFLOW_STATUS_BY_STR = {s.value: s for s in WorkflowStatus}
+
+
+def _to_workflow_status(status: str) -> WorkflowStatus:
+    try:
+        return _WORKFLOW_STATUS_BY_STR[status]
+    except KeyError:
+        valid = [s.value for s in WorkflowStatus if s in _ALL_WORKFLOW_STATUSES]
+        raise ValueError(
+            f"Unknown workflow status {status!r}. Valid ones are {valid}."
+        ) from None
+
+
+# Normalize the "status_filter" argument of "list_all()" into a set of
+# "WorkflowStatus", dispatched by the type of the argument. Sets are
+# handled separately in "list_all()".
+_STATUS_FILTER_NORMALIZERS = {
+    str: lambda s: {_to_workflow_status(s)},
+    WorkflowStatus: lambda s: {s},
+    type(None): lambda s: _ALL_WORKFLOW_STATUSES,
+}
 
 
 @PublicAPI(stability="beta")
@@ -52,13 +81,58 @@ def init() -> None:
         ray.init(storage="file:///tmp/ray/workflow_data")
     workflow_access.init_management_actor()
     serialization.init_manager()
-    global _is_workflow_initialized
-    _is_workflow_initialized = True
+    global _workflow_node, _workflow_client_worker
+    _workflow_node = ray.worker.global_worker.node
+    _workflow_client_worker = _get_client_worker() if _workflow_node is None else None
+
+
+def _get_client_worker() -> Optional["ray.util.client.worker.Worker"]:
+    if ray.util.client.ray.is_connected():
+        return ray.util.client.ray.get_context().client_worker
+    return None
 
 
 def _ensure_workflow_initialized() -> None:
-    if not _is_workflow_initialized or not ray.is_initialized():
-        init()
+    # NOTE: This is on the path of every workflow API call, so the common case
+    # is only an identity check of the node. The node is None after Ray is
+    # shut down, and a new node is created whenever Ray is initialized again.
+    node = ray.worker.global_worker.node
+    if node is not None:
+        if node is _workflow_node:
+            return
+    elif (
+        _workflow_client_worker is not None
+        and _get_client_worker() is _workflow_client_worker
+    ):
+        return
+    init()
+
+
+def _check_workflow_id(workflow_id: str) -> None:
+    if type(workflow_id) is not str:
+        raise TypeError("workflow_id has to be a string type.")
+
+
+def _check_workflow_ids(workflow_ids: List[str]) -> None:
+    if not isinstance(workflow_ids, list):
+        raise TypeError("workflow_ids has to be a list of strings.")
+    for workflow_id in workflow_ids:
+        _check_workflow_id(workflow_id)
+
+
+def _normalize_step_names(
+    workflow_ids: List[str], names: Optional[List[Optional[str]]]
+) -> List[Optional[str]]:
+    if names is None:
+        return [None] * len(workflow_ids)
+    if not isinstance(names, list):
+        raise TypeError("names has to be a list.")
+    if len(names) != len(workflow_ids):
+        raise ValueError(
+            f"The number of step names ({len(names)}) does not match "
+            f"the number of workflows ({len(workflow_ids)})."
+        )
+    return names
 
 
 def make_step_decorator(
@@ -167,6 +241,39 @@ def get_output(workflow_id: str, *, name: Optional[str] = None) -> ray.ObjectRef
     return execution.get_output(workflow_id, name)
 
 
+@PublicAPI(stability="beta")
+def get_output_many(
+    workflow_ids: List[str], *, names: Optional[List[Optional[str]]] = None
+) -> List[ray.ObjectRef]:
+    """Get the outputs of a list of workflows.
+
+    This is the batched version of ``get_output()``. It only makes one call
+    to the workflow management actor for all workflows.
+
+    Args:
+        workflow_ids: The workflows to get the outputs of.
+        names: If set, fetch the specific steps instead of the outputs of the
+            workflows. It must have the same length as ``workflow_ids``; a
+            ``None`` element fetches the output of the corresponding workflow.
+
+    Examples:
+        >>> from ray import workflow
+        >>> trip = ... # doctest: +SKIP
+        >>> res1 = trip.run_async(workflow_id="trip1") # doctest: +SKIP
+        >>> res2 = trip.run_async(workflow_id="trip2") # doctest: +SKIP
+        >>> outputs = workflow.get_output_many(["trip1", "trip2"]) # doctest: +SKIP
+        >>> assert ray.get(outputs) == ray.get([res1, res2]) # doctest: +SKIP
+
+    Returns:
+        A list of object references that can be used to retrieve the
+        workflow results, in the order of ``workflow_ids``.
+    """
+    _ensure_workflow_initialized()
+    _check_workflow_ids(workflow_ids)
+    names = _normalize_step_names(workflow_ids, names)
+    return execution.get_output_many(workflow_ids, names)
+
+
 @PublicAPI(stability="beta")
 def list_all(
     status_filter: Optional[
@@ -200,22 +307,19 @@ def list_all(
         A list of tuple with workflow id and workflow status
     """
     _ensure_workflow_initialized()
-    if isinstance(status_filter, str):
-        status_filter = set({WorkflowStatus(status_filter)})
-    elif isinstance(status_filter, WorkflowStatus):
-        status_filter = set({status_filter})
+    normalize = _STATUS_FILTER_NORMALIZERS.get(type(status_filter))
+    if normalize is not None:
+        status_filter = normalize(status_filter)
     elif isinstance(status_filter, set):
-        if all(isinstance(s, str) for s in status_filter):
-            status_filter = {WorkflowStatus(s) for s in status_filter}
-        elif not all(isinstance(s, WorkflowStatus) for s in status_filter):
+        # "WorkflowStatus" is a subclass of "str", so a single check
+        # covers both kinds of elements.
+        if not all(isinstance(s, str) for s in status_filter):
             raise TypeError(
                 "status_filter contains element which is not"
                 " a type of `WorkflowStatus or str`."
                 f" {status_filter}"
             )
-    elif status_filter is None:
-        status_filter = set(WorkflowStatus)
-        status_filter.discard(WorkflowStatus.NONE)
+        status_filter = {_to_workflow_status(s) for s in status_filter}
     else:
         raise TypeError(
             "status_filter must be WorkflowStatus or a set of WorkflowStatus."
@@ -271,11 +375,53 @@ def get_status(workflow_id: str) -> WorkflowStatus:
         The status of that workflow
     """
     _ensure_workflow_initialized()
-    if not isinstance(workflow_id, str):
-        raise TypeError("workflow_id has to be a string type.")
+    _check_workflow_id(workflow_id)
     return execution.get_status(workflow_id)
 
 
+@PublicAPI(stability="beta")
+def get_status_many(workflow_ids: List[str]) -> List[WorkflowStatus]:
+    """Get the statuses for a list of workflows.
+
+    This is the batched version of ``get_status()``. It only makes one call
+    to the workflow management actor for all workflows.
+
+    Args:
+        workflow_ids: The workflows to query.
+
+    Examples:
+        >>> from ray import workflow
+        >>> trip = ... # doctest: +SKIP
+        >>> trip.run(workflow_id="trip1") # doctest: +SKIP
+        >>> trip.run(workflow_id="trip2") # doctest: +SKIP
+        >>> assert workflow.get_status_many( # doctest: +SKIP
+        ...     ["trip1", "trip2"]) == [workflow.SUCCESSFUL] * 2
+
+    Returns:
+        The statuses of the workflows, in the order of ``workflow_ids``.
+    """
+    _ensure_workflow_initialized()
+    _check_workflow_ids(workflow_ids)
+    return execution.get_status_many(workflow_ids)
+
+
+# NOTE: The event steps are defined once at module level, so that calling
+# "wait_for_event()" does not create and export new remote functions each time.
+# Polling and committing have to stay in separate steps: "event_checkpointed"
+# must only be called after the output of the polling step is checkpointed.
+@ray.remote
+def get_message(event_listener_type: EventListenerType, *args, **kwargs) -> Event:
+    event_listener = event_listener_type()
+    return asyncio_run(event_listener.poll_for_event(*args, **kwargs))
+
+
+@ray.remote
+def message_committed(event_listener_type: EventListenerType, event: Event) -> Event:
+    event_listener = event_listener_type()
+    asyncio_run(event_listener.event_checkpointed(event))
+    return event
+
+
 @PublicAPI(stability="beta")
 def wait_for_event(
     event_listener_type: EventListenerType, *args, **kwargs
@@ -286,22 +432,12 @@ def wait_for_event(
             ", which is not a subclass of workflow.EventListener"
         )
 
-    @ray.remote
-    def get_message(event_listener_type: EventListenerType, *args, **kwargs) -> Event:
-        event_listener = event_listener_type()
-        return asyncio_run(event_listener.poll_for_event(*args, **kwargs))
-
-    @ray.remote
-    def message_committed(
-        event_listener_type: EventListenerType, event: Event
-    ) -> Event:
-        event_listener = event_listener_type()
-        asyncio_run(event_listener.event_checkpointed(event))
+    event = get_message.bind(event_listener_type, *args, **kwargs)
+    if event_listener_type.event_checkpointed is EventListener.event_checkpointed:
+        # The listener does not commit events, so we can skip the extra step
+        # on the critical path (e.g. for "workflow.sleep()").
         return event
-
-    return message_committed.bind(
-        event_listener_type, get_message.bind(event_listener_type, *args, **kwargs)
-    )
+    return message_committed.bind(event_listener_type, event)
 
 
 @PublicAPI(stability="beta")
@@ -370,6 +506,34 @@ def get_metadata(workflow_id: str, name: Optional[str] = None) -> Dict[str, Any]
     return execution.get_metadata(workflow_id, name)
 
 
+@PublicAPI(stability="beta")
+def get_metadata_many(
+    workflow_ids: List[str], *, names: Optional[List[Optional[str]]] = None
+) -> List[Dict[str, Any]]:
+    """Get the metadata of a list of workflows.
+
+    This is the batched version of ``get_metadata()``.
+
+    Args:
+        workflow_ids: The workflows to get the metadata of.
+        names: If set, fetch the metadata of the specific steps instead of
+            the metadata of the workflows. It must have the same length as
+            ``workflow_ids``; a ``None`` element fetches the metadata of the
+            corresponding workflow.
+
+    Returns:
+        A list of dictionaries containing the metadata, in the order of
+        ``workflow_ids``.
+
+    Raises:
+        ValueError: if any given workflow or workflow step does not exist.
+    """
+    _ensure_workflow_initialized()
+    _check_workflow_ids(workflow_ids)
+    names = _normalize_step_names(workflow_ids, names)
+    return execution.get_metadata_many(workflow_ids, names)
+
+
 @PublicAPI(stability="beta")
 def cancel(workflow_id: str) -> None:
     """Cancel a workflow. Workflow checkpoints will still be saved in storage. To
@@ -392,8 +556,7 @@ def cancel(workflow_id: str) -> None:
 
     """
     _ensure_workflow_initialized()
-    if not isinstance(workflow_id, str):
-        raise TypeError("workflow_id has to be a string type.")
+    _check_workflow_id(workflow_id)
     return execution.cancel(workflow_id)
 
 
@@ -423,16 +586,12 @@ def delete(workflow_id: str) -> None:
     """
 
     _ensure_workflow_initialized()
+    _check_workflow_id(workflow_id)
     try:
-        status = get_status(workflow_id)
-        if status == WorkflowStatus.RUNNING:
-            raise WorkflowRunningError("DELETE", workflow_id)
+        execution.delete(workflow_id)
     except ValueError:
         raise WorkflowNotFoundError(workflow_id)
 
-    wf_storage = get_workflow_storage(workflow_id)
-    wf_storage.delete_workflow()
-
 
 WaitResult = Tuple[List[Any], List[Workflow]]
 
@@ -523,8 +682,6 @@ def create(dag_node: "DAGNode", *args, **kwargs) -> Workflow:
         args: Positional arguments of the DAG input node.
         kwargs: Keyword arguments of the DAG input node.
     """
-    from ray.workflow.dag_to_workflow import transform_ray_dag_to_workflow
-
     if not isinstance(dag_node, DAGNode):
         raise TypeError("Input should be a DAG.")
     input_context = DAGInputData(*args, **kwargs)
@@ -542,8 +699,6 @@ def continuation(dag_node: "DAGNode") -> Union[Workflow, ray.ObjectRef]:
     Args:
         dag_node: The DAG to be converted.
     """
-    from ray.workflow.workflow_context import in_workflow_execution
-
     if not isinstance(dag_node, DAGNode):
         raise TypeError("Input should be a DAG.")
 
@@ -552,6 +707,18 @@ def continuation(dag_node: "DAGNode") -> Union[Workflow, ray.ObjectRef]:
     return ray.get(dag_node.execute())
 
 
+_VALID_WORKFLOW_OPTIONS = frozenset(
+    {
+        "name",
+        "metadata",
+        "catch_exceptions",
+        "max_retries",
+        "allow_inplace",
+        "checkpoint",
+    }
+)
+
+
 @PublicAPI(stability="beta")
 class options:
     """This class serves both as a decorator and options for workflow.
@@ -570,25 +737,17 @@ class options:
         >>> foo_new = foo.options(**workflow.options(catch_exceptions=False))
     """
 
+    __slots__ = ("options",)
+
     def __init__(self, **workflow_options: Dict[str, Any]):
         # TODO(suquark): More rigid arguments check like @ray.remote arguments. This is
         # fairly complex, but we should enable it later.
-        valid_options = {
-            "name",
-            "metadata",
-            "catch_exceptions",
-            "max_retries",
-            "allow_inplace",
-            "checkpoint",
-        }
-        invalid_keywords = set(workflow_options.keys()) - valid_options
+        invalid_keywords = workflow_options.keys() - _VALID_WORKFLOW_OPTIONS
         if invalid_keywords:
             raise ValueError(
                 f"Invalid option keywords {invalid_keywords} for workflow steps. "
-                f"Valid ones are {valid_options}."
+                f"Valid ones are {set(_VALID_WORKFLOW_OPTIONS)}."
             )
-        from ray.workflow.common import WORKFLOW_OPTIONS
-
         self.options = {"_metadata": {WORKFLOW_OPTIONS: workflow_options}}
 
     def keys(self):
@@ -600,7 +759,10 @@ class options:
     def __call__(self, f: RemoteFunction) -> RemoteFunction:
         if not isinstance(f, RemoteFunction):
             raise ValueError("Only apply 'workflow.options' to Ray remote functions.")
-        f._default_options.update(self.options)
+        # Only replace the workflow namespace of "_metadata", so that metadata
+        # of other namespaces set on the function is kept.
+        metadata = f._default_options.get("_metadata") or {}
+        f._default_options["_metadata"] = {**metadata, **self.options["_metadata"]}
         return f
 
 
@@ -608,9 +770,12 @@ __all__ = (
     "step",
     "resume",
     "get_output",
+    "get_output_many",
     "resume_all",
     "get_status",
+    "get_status_many",
     "get_metadata",
+    "get_metadata_many",
     "cancel",
     "options",
 )
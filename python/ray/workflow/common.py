@@ -28,9 +28,13 @@ WORKFLOW_OPTIONS = "workflow.io/options"
 
 
 def asyncio_run(coro):
+    # NOTE: Unlike "asyncio.run()", we reuse the event loop of the current
+    # thread across calls instead of creating and closing a loop every time.
     try:
         loop = asyncio.get_event_loop()
     except RuntimeError:
+        loop = None
+    if loop is None or loop.is_closed():
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
     return loop.run_until_complete(coro)
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import time
-from typing import Set, List, Tuple, Optional, TYPE_CHECKING, Dict, Any
+from typing import AbstractSet, List, Tuple, Optional, TYPE_CHECKING, Dict, Any
 import uuid
 
 import ray
@@ -106,6 +106,15 @@ def get_output(workflow_id: str, name: Optional[str]) -> ray.ObjectRef:
     """Get the output of a running workflow.
     See "api.get_output()" for details.
     """
+    return get_output_many([workflow_id], [name])[0]
+
+
+def get_output_many(
+    workflow_ids: List[str], names: List[Optional[str]]
+) -> List[ray.ObjectRef]:
+    """Get the outputs of workflows with one call to the management actor.
+    See "api.get_output_many()" for details.
+    """
     from ray.workflow.api import _ensure_workflow_initialized
 
     _ensure_workflow_initialized()
@@ -117,8 +126,11 @@ def get_output(workflow_id: str, name: Optional[str]) -> ray.ObjectRef:
             "actor. The workflow could have already failed. You can use "
             "workflow.resume() to resume the workflow."
         ) from e
-    output = ray.get(workflow_manager.get_output.remote(workflow_id, name))
-    return flatten_workflow_output(workflow_id, output)
+    outputs = ray.get(workflow_manager.get_output_many.remote(workflow_ids, names))
+    return [
+        flatten_workflow_output(workflow_id, output)
+        for workflow_id, output in zip(workflow_ids, outputs)
+    ]
 
 
 def cancel(workflow_id: str) -> None:
@@ -135,21 +147,44 @@ def cancel(workflow_id: str) -> None:
     ray.get(workflow_manager.cancel_workflow.remote(workflow_id))
 
 
+def delete(workflow_id: str) -> None:
+    """Delete a workflow if it is not running. See "api.delete()" for details."""
+    try:
+        workflow_manager = get_management_actor()
+    except ValueError:
+        # Without the workflow management actor, no workflow can be running.
+        wf_store = workflow_storage.get_workflow_storage(workflow_id)
+        wf_store.delete_workflow()
+        return
+    ray.get(workflow_manager.delete_workflow.remote(workflow_id))
+
+
 def get_status(workflow_id: str) -> Optional[WorkflowStatus]:
+    return get_status_many([workflow_id])[0]
+
+
+def get_status_many(workflow_ids: List[str]) -> List[WorkflowStatus]:
+    """Get the status of workflows with one call to the management actor.
+    See "api.get_status_many()" for details.
+    """
     try:
         workflow_manager = get_management_actor()
-        running = ray.get(workflow_manager.is_workflow_running.remote(workflow_id))
+        runnings = ray.get(workflow_manager.are_workflows_running.remote(workflow_ids))
     except Exception:
-        running = False
-    if running:
-        return WorkflowStatus.RUNNING
-    store = workflow_storage.get_workflow_storage(workflow_id)
-    status = store.load_workflow_status()
-    if status == WorkflowStatus.NONE:
-        raise WorkflowNotFoundError(workflow_id)
-    if status == WorkflowStatus.RUNNING:
-        return WorkflowStatus.RESUMABLE
-    return status
+        runnings = [False] * len(workflow_ids)
+    statuses = []
+    for workflow_id, running in zip(workflow_ids, runnings):
+        if running:
+            statuses.append(WorkflowStatus.RUNNING)
+            continue
+        store = workflow_storage.get_workflow_storage(workflow_id)
+        status = store.load_workflow_status()
+        if status == WorkflowStatus.NONE:
+            raise WorkflowNotFoundError(workflow_id)
+        if status == WorkflowStatus.RUNNING:
+            status = WorkflowStatus.RESUMABLE
+        statuses.append(status)
+    return statuses
 
 
 def get_metadata(workflow_id: str, name: Optional[str]) -> Dict[str, Any]:
@@ -163,7 +198,22 @@ def get_metadata(workflow_id: str, name: Optional[str]) -> Dict[str, Any]:
         return store.load_step_metadata(name)
 
 
-def list_all(status_filter: Set[WorkflowStatus]) -> List[Tuple[str, WorkflowStatus]]:
+def get_metadata_many(
+    workflow_ids: List[str], names: List[Optional[str]]
+) -> List[Dict[str, Any]]:
+    """Get the metadata of workflows. Metadata is loaded from the storage
+    directly, so no call to the management actor is needed.
+    See "api.get_metadata_many()" for details.
+    """
+    return [
+        get_metadata(workflow_id, name)
+        for workflow_id, name in zip(workflow_ids, names)
+    ]
+
+
+def list_all(
+    status_filter: AbstractSet[WorkflowStatus],
+) -> List[Tuple[str, WorkflowStatus]]:
     try:
         workflow_manager = get_management_actor()
     except ValueError:
@@ -181,15 +231,17 @@ def list_all(status_filter: Set[WorkflowStatus]) -> List[Tuple[str, WorkflowStat
     store = workflow_storage.get_workflow_storage("")
 
     exclude_running = False
+    storage_status_filter = status_filter
     if (
         WorkflowStatus.RESUMABLE in status_filter
         and WorkflowStatus.RUNNING not in status_filter
     ):
         # Here we have to add "RUNNING" to the status filter, because some "RESUMABLE"
-        # workflows are converted from "RUNNING" workflows below.
+        # workflows are converted from "RUNNING" workflows below. The input filter
+        # is not modified, because it could be shared by the caller.
         exclude_running = True
-        status_filter.add(WorkflowStatus.RUNNING)
-    status_from_storage = store.list_workflow(status_filter)
+        storage_status_filter = status_filter | {WorkflowStatus.RUNNING}
+    status_from_storage = store.list_workflow(storage_status_filter)
     ret = []
     for (k, s) in status_from_storage:
         if s == WorkflowStatus.RUNNING:
@@ -358,6 +358,32 @@ def test_workflow_error_message():
     assert str(e.value) == expected_error_msg
 
 
+def test_workflow_reinit_after_ray_restart(tmp_path):
+    from ray.workflow import api
+
+    if ray.is_initialized():
+        ray.shutdown()
+    ray.init(storage=str(tmp_path))
+    workflow.init()
+    node = api._workflow_node
+    assert node is not None and node is ray.worker.global_worker.node
+    ray.shutdown()
+
+    ray.init(storage=str(tmp_path))
+    # Re-initializing Ray invalidates the previous workflow initialization.
+    assert ray.worker.global_worker.node is not node
+
+    @ray.remote
+    def f():
+        return 1
+
+    # The workflow API initializes workflow again.
+    assert workflow.create(f.bind()).run(workflow_id="reinit") == 1
+    assert api._workflow_node is ray.worker.global_worker.node
+    assert workflow.list_all(workflow.RUNNING) == []
+    ray.shutdown()
+
+
 def test_options_update():
     from ray.workflow.common import WORKFLOW_OPTIONS
 
@@ -390,6 +416,21 @@ def test_options_update():
     }
 
 
+def test_options_decorator_keeps_other_metadata():
+    from ray.workflow.common import WORKFLOW_OPTIONS
+
+    @workflow.options(name="new_name")
+    @workflow.options(name="old_name", max_retries=1)
+    @ray.remote(_metadata={"other.io/options": {"k": "v"}})
+    def f():
+        return
+
+    assert f._default_options["_metadata"] == {
+        "other.io/options": {"k": "v"},
+        WORKFLOW_OPTIONS: {"name": "new_name"},
+    }
+
+
 if __name__ == "__main__":
     import sys
 
@@ -305,6 +305,48 @@ def test_types(workflow_start_regular_shared):
         workflow.wait_for_event(NotAnEventListener)
 
 
+def test_commit_step_only_for_committing_listeners():
+    class CommittingListener(workflow.EventListener):
+        async def poll_for_event(self):
+            pass
+
+        async def event_checkpointed(self, event):
+            pass
+
+    # TimerListener does not override "event_checkpointed", so no extra
+    # step is needed to commit the event.
+    assert workflow.sleep(1)._body.__name__ == "get_message"
+    event_node = workflow.wait_for_event(CommittingListener)
+    assert event_node._body.__name__ == "message_committed"
+    assert event_node.get_args()[1]._body.__name__ == "get_message"
+
+
+def test_asyncio_run_replaces_closed_loop():
+    from ray.workflow.common import asyncio_run
+
+    async def answer():
+        return 42
+
+    try:
+        previous_loop = asyncio.get_event_loop()
+    except RuntimeError:
+        previous_loop = None
+    # Use a private loop, so that the loop shared by other tests is untouched.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.close()
+        assert asyncio_run(answer()) == 42
+        new_loop = asyncio.get_event_loop()
+        assert new_loop is not loop
+        assert not new_loop.is_closed()
+        # The new loop is reused by later calls.
+        assert asyncio_run(answer()) == 42
+        assert asyncio.get_event_loop() is new_loop
+    finally:
+        asyncio.get_event_loop().close()
+        asyncio.set_event_loop(previous_loop)
+
 if __name__ == "__main__":
     import sys
 
@@ -25,6 +25,24 @@ def foo(x):
         return 20
 
 
+def test_workflow_reinit_after_reconnect(workflow_start_cluster):
+    from ray.workflow import api
+
+    address, storage_uri = workflow_start_cluster
+    ray.init(address=address)
+    workflow.init()
+    node = api._workflow_node
+    assert node is ray.worker.global_worker.node
+    ray.shutdown()
+
+    # Reconnect to the same cluster. The workflow API initializes workflow
+    # again for the new connection.
+    ray.init(address=address)
+    assert ray.worker.global_worker.node is not node
+    assert workflow.list_all() == []
+    assert api._workflow_node is ray.worker.global_worker.node
+
+
 if __name__ == "__main__":
     ray.init()
     output = workflow.create(foo.bind(0)).run_async(workflow_id="driver_terminated")
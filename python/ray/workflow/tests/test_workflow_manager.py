@@ -10,6 +10,56 @@ def test_workflow_manager_simple(workflow_start_regular):
         workflow.get_status("X")
 
 
+def test_list_all_status_filter(workflow_start_regular):
+    assert [] == workflow.list_all("RUNNING")
+    assert [] == workflow.list_all({"FAILED", workflow.RESUMABLE})
+    with pytest.raises(ValueError, match="Unknown workflow status 'NOT_A_STATUS'") as e:
+        workflow.list_all("NOT_A_STATUS")
+    assert "NONE" not in str(e.value)
+    with pytest.raises(ValueError):
+        workflow.list_all({"FAILED", "NOT_A_STATUS"})
+    with pytest.raises(TypeError):
+        workflow.list_all({"FAILED", 1})
+    with pytest.raises(TypeError):
+        workflow.list_all(1)
+
+
+def test_workflow_manager_batched_apis(workflow_start_regular):
+    @workflow.options(name="double", metadata={"k": "v"})
+    @ray.remote
+    def double(x):
+        return 2 * x
+
+    workflow_ids = [str(i) for i in range(3)]
+    for i, workflow_id in enumerate(workflow_ids):
+        workflow.create(double.bind(i)).run(workflow_id=workflow_id, metadata={"i": i})
+
+    outputs = workflow.get_output_many(workflow_ids)
+    assert ray.get(outputs) == [0, 2, 4]
+    outputs = workflow.get_output_many(workflow_ids, names=["double", None, "double"])
+    assert ray.get(outputs) == [0, 2, 4]
+    assert workflow.get_status_many(workflow_ids) == [workflow.SUCCESSFUL] * 3
+    metadata = workflow.get_metadata_many(workflow_ids)
+    assert [m["status"] for m in metadata] == ["SUCCESSFUL"] * 3
+    assert [m["user_metadata"] for m in metadata] == [{"i": i} for i in range(3)]
+    metadata = workflow.get_metadata_many(workflow_ids, names=["double"] * 3)
+    assert [m["user_metadata"] for m in metadata] == [{"k": "v"}] * 3
+
+    with pytest.raises(ValueError):
+        workflow.get_output_many(workflow_ids, names=["double"])
+    for batched_api in (
+        workflow.get_output_many,
+        workflow.get_status_many,
+        workflow.get_metadata_many,
+    ):
+        with pytest.raises(TypeError):
+            batched_api("0")
+        with pytest.raises(TypeError):
+            batched_api(["0", 1])
+    with pytest.raises(workflow.common.WorkflowNotFoundError):
+        workflow.get_status_many(workflow_ids + ["X"])
+
+
 def test_workflow_manager(workflow_start_regular, tmp_path):
     # For sync between jobs
     tmp_file = str(tmp_path / "lock")
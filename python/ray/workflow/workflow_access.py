@@ -248,11 +248,30 @@ class WorkflowManagementActor:
         cancel_job(self._workflow_outputs.pop(workflow_id).output)
         self._update_workflow_status(workflow_id, common.WorkflowStatus.CANCELED)
 
+    def delete_workflow(self, workflow_id: str) -> None:
+        """Delete a workflow and its checkpoints if it is not running.
+
+        Args:
+            workflow_id: The ID of the workflow.
+
+        Raises:
+            WorkflowRunningError: When the workflow is still running.
+            WorkflowNotFoundError: When the workflow does not exist.
+        """
+        if self.is_workflow_running(workflow_id):
+            raise common.WorkflowRunningError("DELETE", workflow_id)
+        self._workflow_status.pop(workflow_id, None)
+        wf_store = workflow_storage.WorkflowStorage(workflow_id)
+        wf_store.delete_workflow()
+
     def is_workflow_running(self, workflow_id: str) -> bool:
         return (
             workflow_id in self._step_status and workflow_id in self._workflow_outputs
         )
 
+    def are_workflows_running(self, workflow_ids: List[str]) -> List[bool]:
+        return [self.is_workflow_running(wid) for wid in workflow_ids]
+
     def list_running_workflow(self) -> List[str]:
         return list(self._step_status.keys())
 
@@ -313,6 +332,24 @@ class WorkflowManagementActor:
             load.remote(wf_store, workflow_id, step_id),
         )
 
+    def get_output_many(
+        self, workflow_ids: List[str], names: List[Optional[str]]
+    ) -> List[WorkflowStaticRef]:
+        """Get the outputs of a list of workflows in one call.
+
+        Args:
+            workflow_ids: The IDs of the workflow jobs.
+            names: The names of the steps to get the output of. None means
+                the output of the workflow.
+
+        Returns:
+            Object references of the outputs, in the order of the inputs.
+        """
+        return [
+            self.get_output(workflow_id, name)
+            for workflow_id, name in zip(workflow_ids, names)
+        ]
+
     def get_running_workflow(self) -> List[str]:
         return list(self._workflow_outputs.keys())
 
@@ -5,7 +5,7 @@ workflows.
 
 import json
 import os
-from typing import Dict, List, Optional, Any, Callable, Tuple, Union, Set
+from typing import Dict, List, Optional, Any, Callable, Tuple, Union, AbstractSet
 from dataclasses import dataclass
 import logging
 
@@ -168,7 +168,7 @@ class WorkflowIndexingStorage:
         return WorkflowStatus.NONE
 
     def list_workflow(
-        self, status_filter: Optional[Set[WorkflowStatus]] = None
+        self, status_filter: Optional[AbstractSet[WorkflowStatus]] = None
     ) -> List[Tuple[str, WorkflowStatus]]:
         """List workflow status. Override status of the workflows whose status updating
         were marked dirty with the workflow status from workflow metadata.
@@ -180,7 +180,7 @@ class WorkflowIndexingStorage:
         if status_filter is None:
             status_filter = set(WorkflowStatus)
             status_filter.discard(WorkflowStatus.NONE)
-        elif not isinstance(status_filter, set):
+        elif not isinstance(status_filter, (set, frozenset)):
             raise TypeError("'status_filter' should either be 'None' or a set.")
         elif WorkflowStatus.NONE in status_filter:
             raise ValueError("'WorkflowStatus.NONE' is not a valid filter value.")
@@ -686,7 +686,7 @@ class WorkflowStorage:
         return _load_workflow_metadata()
 
     def list_workflow(
-        self, status_filter: Optional[Set[WorkflowStatus]] = None
+        self, status_filter: Optional[AbstractSet[WorkflowStatus]] = None
     ) -> List[Tuple[str, WorkflowStatus]]:
         """List all workflows matching a given status filter.
 